@@ -76,6 +76,8 @@ impl AnalysisEngine {
         mut file: SourceFile,
         _rule_config: &Option<crate::types::RuleConfig>,
     ) -> AnalysisResult<FileAnalysisResult> {
+        let start_time = Instant::now();
+
         // Detect language if not provided
         let language = match file.language {
             Some(lang) => lang,
@@ -117,6 +119,7 @@ impl AnalysisEngine {
                 functions_count: count_functions(&file.content),
                 classes_count: count_classes(&file.content),
                 complexity_score: 1.0, // Placeholder
+                parse_duration_ns: start_time.elapsed().as_nanos() as u64,
             },
         })
     }
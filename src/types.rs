@@ -113,6 +113,7 @@ pub struct FileMetrics {
     pub functions_count: u32,
     pub classes_count: u32,
     pub complexity_score: f64,
+    pub parse_duration_ns: u64, // Server-side analysis time for this file
 }
 
 #[derive(Debug, Serialize, Deserialize)]
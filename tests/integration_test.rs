@@ -59,6 +59,7 @@ async fn test_analyze_endpoint() {
     let metrics = &file_result["metrics"];
     assert_eq!(metrics["functions_count"], 1); // Should detect the function
     assert_eq!(metrics["lines_of_code"], 1);
+    assert!(metrics["parse_duration_ns"].as_u64().is_some());
 
     // Clean up
     server_handle.abort();
@@ -4,46 +4,130 @@ Validation script to check the Rust Analysis Engine project structure
 and verify that all required files are present for Week 1 deliverable.
 """
 
+import functools
+import mmap
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def check_file_exists(path, description):
-    """Check if a file exists and print status."""
-    if os.path.exists(path):
+try:
+    import ahocorasick
+except ImportError:  # Optional: fall back to one substring search per needle
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing
+    orjson = None
+
+# File checks are independent syscalls, so they run on a thread pool
+MAX_WORKERS = 16
+
+def check_file_exists(path, description, exists=None):
+    """Check if a file exists and print status.
+    
+    exists may be passed in when it was already checked (e.g. concurrently).
+    """
+    if exists is None:
+        exists = os.path.exists(path)
+    
+    if exists:
         print(f"✅ {description}: {path}")
         return True
     else:
         print(f"❌ {description}: {path} (MISSING)")
         return False
 
-def check_file_contains(path, content, description):
-    """Check if a file contains specific content."""
+@functools.lru_cache(maxsize=None)
+def read_file_bytes(path):
+    """Memory-map a file once so every content check against it shares the mapping."""
+    fd = os.open(path, os.O_RDONLY)
     try:
-        with open(path, 'r') as f:
-            file_content = f.read()
-            if content in file_content:
-                print(f"✅ {description}")
-                return True
-            else:
-                print(f"❌ {description} (MISSING)")
-                return False
-    except FileNotFoundError:
+        # mmap cannot map an empty file
+        if os.fstat(fd).st_size == 0:
+            return b""
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+def find_contents(path, needles):
+    """Return the needles that occur in a file.
+    
+    With pyahocorasick installed all needles are matched in a single pass over
+    the file; otherwise each needle is searched for separately.
+    """
+    data = read_file_bytes(path)
+    if ahocorasick is None or not needles:
+        return {needle for needle in needles if data.find(needle.encode()) != -1}
+    
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return {needle for _, needle in automaton.iter(bytes(data).decode('utf-8', errors='replace'))}
+
+def scan_contents(content_checks):
+    """Scan each file once for all of its content checks, files in parallel.
+    
+    Returns a mapping of path to the set of needles found, with None for
+    files that do not exist.
+    """
+    needles_by_path = {}
+    for path, content, _ in content_checks:
+        needles_by_path.setdefault(path, set()).add(content)
+    
+    def scan_file(item):
+        path, needles = item
+        try:
+            return path, find_contents(path, needles)
+        except FileNotFoundError:
+            return path, None
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return dict(executor.map(scan_file, needles_by_path.items()))
+
+def check_file_contains(path, content, description, found_contents=None):
+    """Check if a file contains specific content.
+    
+    found_contents is an optional result of scan_contents(); without it the
+    file is searched directly.
+    """
+    if found_contents is None:
+        found_contents = scan_contents([(path, content, description)])
+    
+    found = found_contents.get(path)
+    if found is None:
         print(f"❌ {description} - File not found: {path}")
         return False
+    
+    if content in found:
+        print(f"✅ {description}")
+        return True
+    else:
+        print(f"❌ {description} (MISSING)")
+        return False
+
+def load_json(path):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is None:
+        with open(path, 'r') as f:
+            return json.load(f)
+    
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return orjson.loads(Path(path).read_bytes())
 
 def validate_json_structure(path, expected_keys, description):
     """Validate JSON file structure."""
     try:
-        with open(path, 'r') as f:
-            data = json.load(f)
-            missing_keys = [key for key in expected_keys if key not in data]
-            if not missing_keys:
-                print(f"✅ {description}")
-                return True
-            else:
-                print(f"❌ {description} - Missing keys: {missing_keys}")
-                return False
+        data = load_json(path)
+        missing_keys = [key for key in expected_keys if key not in data]
+        if not missing_keys:
+            print(f"✅ {description}")
+            return True
+        else:
+            print(f"❌ {description} - Missing keys: {missing_keys}")
+            return False
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"❌ {description} - Error: {e}")
         return False
@@ -71,13 +155,16 @@ def main():
         ("test_api.sh", "API test script"),
     ]
     
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        exists = list(executor.map(os.path.exists, [file_path for file_path, _ in checks]))
+    
+    # Results are printed after the pool finishes to keep the output order stable
     print("\n📁 File Structure Check:")
-    for file_path, description in checks:
-        if not check_file_exists(file_path, description):
+    for (file_path, description), file_exists in zip(checks, exists):
+        if not check_file_exists(file_path, description, file_exists):
             all_checks_passed = False
     
     # Content checks
-    print("\n📝 Content Validation:")
     content_checks = [
         ("src/server/mod.rs", "/analyze", "Analyze endpoint"),
         ("src/server/mod.rs", "/health", "Health endpoint"),
@@ -89,19 +176,11 @@ def main():
         ("Dockerfile", "rust:1.75", "Rust base image"),
     ]
     
-    for file_path, content, description in content_checks:
-        if not check_file_contains(file_path, content, description):
-            all_checks_passed = False
-    
     # Cargo.toml validation
-    print("\n📦 Dependency Check:")
     cargo_deps = ["axum", "tokio", "serde", "tracing", "thiserror"]
-    for dep in cargo_deps:
-        if not check_file_contains("Cargo.toml", dep, f"Dependency: {dep}"):
-            all_checks_passed = False
+    dependency_checks = [("Cargo.toml", dep, f"Dependency: {dep}") for dep in cargo_deps]
     
     # API structure validation
-    print("\n🌐 API Structure Check:")
     api_checks = [
         ("src/types.rs", "pub struct AnalysisRequest", "Request structure"),
         ("src/types.rs", "pub struct AnalysisResponse", "Response structure"),
@@ -110,9 +189,18 @@ def main():
         ("src/types.rs", "pub enum Language", "Language enum"),
     ]
     
-    for file_path, content, description in api_checks:
-        if not check_file_contains(file_path, content, description):
-            all_checks_passed = False
+    # Scan each file once for every needle it is checked for
+    found_contents = scan_contents(content_checks + dependency_checks + api_checks)
+    
+    for title, section_checks in [
+        ("📝 Content Validation:", content_checks),
+        ("📦 Dependency Check:", dependency_checks),
+        ("🌐 API Structure Check:", api_checks),
+    ]:
+        print(f"\n{title}")
+        for file_path, content, description in section_checks:
+            if not check_file_contains(file_path, content, description, found_contents):
+                all_checks_passed = False
     
     print("\n" + "=" * 55)
     if all_checks_passed: